@@ -1,11 +1,21 @@
+import ast
 import contextlib
+import hashlib
+import importlib.util
+import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import yaml
+
 # Ensure UTF-8 output on Windows where the default encoding (cp1252) cannot
 # encode the Unicode symbols (✔ ℹ ⚠ ✗ 🚀) used in the output below.
 if hasattr(sys.stdout, 'reconfigure'):
@@ -44,6 +54,55 @@ class Colors:
         return f"{Colors.BOLD}{Colors.CYAN}[{num}/{total}]{Colors.END} {msg}"
 
 
+class Timings:
+    """Wall time of each setup step, for the report printed at the end."""
+
+    def __init__(self):
+        self.steps = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def step(self, name):
+        """Time the step ``name``, recording whether it raised."""
+        start = time.perf_counter()
+        status = 'ok'
+        try:
+            yield
+        except BaseException:
+            status = 'failed'
+            raise
+        finally:
+            self._add(name, time.perf_counter() - start, status)
+
+    def skip(self, name, reason):
+        self._add(name, 0.0, f'skipped ({reason})')
+
+    def _add(self, name, seconds, status):
+        with self._lock:
+            self.steps.append(
+                {'step': name, 'seconds': seconds, 'status': status}
+            )
+
+    @property
+    def total(self):
+        return time.perf_counter() - self._start
+
+    def report(self):
+        width = max([len(s['step']) for s in self.steps] + [5])
+        lines = [Colors.info('Setup timings:')]
+        for s in self.steps:
+            lines.append(
+                f'    {s["step"]:<{width}}  {s["seconds"]:7.2f}s  {s["status"]}'
+            )
+        lines.append(f'    {"total":<{width}}  {self.total:7.2f}s')
+        return '\n'.join(lines)
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            json.dump({'steps': self.steps, 'total': self.total}, f, indent=2)
+
+
 def module_name_pep8_compliance(module_name):
     """Validate that the plugin module name is PEP8 compliant."""
     if not re.match(r'^[a-z][_a-z0-9]+$', module_name):
@@ -61,13 +120,14 @@ def pypi_package_name_compliance(plugin_name):
 
 
 def validate_manifest(module_name, project_directory):
-    """Validate the new plugin repository against napari requirements."""
-    try:
-        from npe2 import PluginManifest
-    except ImportError:
-        print(Colors.warning('npe2 is not installed. Skipping manifest validation.'))
-        return True
-
+    """Validate the new plugin repository against napari requirements.
+
+    The manifest is validated against the npe2 schema, and every
+    ``python_name`` it references is checked to exist, by parsing the
+    sources rather than importing them. Valid results are cached by the hash
+    of the manifest and of the sources, so that validating the same plugin
+    again doesn't even import npe2: see ``_manifest_cache_dir``.
+    """
     current_directory = Path('.').absolute()
     if (
         current_directory.match(project_directory)
@@ -75,7 +135,49 @@ def validate_manifest(module_name, project_directory):
     ):
         project_directory = current_directory
 
-    path = Path(project_directory) / 'src' / Path(module_name) / 'napari.yaml'
+    src = Path(project_directory) / 'src'
+    path = src / Path(module_name) / 'napari.yaml'
+
+    try:
+        manifest = yaml.safe_load(path.read_bytes())
+        key = _manifest_hash(path, module_name)
+    except (FileNotFoundError, PermissionError, OSError) as err:
+        print(
+            Colors.error(
+                f'Failed to read {path!r}. {type(err).__name__}: {err}'
+            )
+        )
+        sys.exit(1)
+    except yaml.YAMLError as err:
+        print(Colors.error(f'Invalid manifest: {err}'))
+        sys.exit(1)
+
+    cache = _manifest_cache_dir()
+    cached = cache / key if cache is not None else None
+    if cached is not None:
+        with contextlib.suppress(OSError):
+            print(Colors.success(cached.read_text() + ' (cached)'))
+            return True
+
+    errors = [
+        f'{python_name}: {error}'
+        for python_name, error in _check_python_names(src, manifest)
+    ]
+    if errors:
+        print(Colors.error('Invalid manifest, python_name not found:'))
+        for error in errors:
+            print(f'  {error}')
+        sys.exit(1)
+
+    try:
+        from npe2 import PluginManifest
+    except ImportError:
+        print(
+            Colors.warning(
+                'npe2 is not installed. Skipping manifest schema validation.'
+            )
+        )
+        return True
 
     valid = False
     try:
@@ -89,18 +191,209 @@ def validate_manifest(module_name, project_directory):
         print(Colors.error(f'Failed to read {path!r}. {type(err).__name__}: {err}'))
         sys.exit(1)
     else:
+        if cached is not None:
+            with contextlib.suppress(OSError):
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                cached.write_text(msg)
         print(Colors.success(msg))
         return valid
 
 
+# bump to invalidate the cached manifest validations
+MANIFEST_CACHE_VERSION = 1
+
+
+def _manifest_cache_dir():
+    """Directory of the cached manifest validations, or None if disabled.
+
+    This is ``$NAPARI_TEMPLATE_CACHE/manifests``, by default in
+    ``$XDG_CACHE_HOME`` (``~/.cache``); ``NAPARI_TEMPLATE_CACHE=0`` turns
+    the cache off.
+    """
+    if os.environ.get('NAPARI_TEMPLATE_CACHE') == '0':
+        return None
+    cache = os.environ.get('NAPARI_TEMPLATE_CACHE') or os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+        'napari-plugin-template',
+    )
+    return Path(cache) / 'manifests'
+
+
+def _manifest_hash(path, module_name):
+    """Hash of the manifest at ``path`` and of the sources of the package."""
+    digest = hashlib.sha256(f'{MANIFEST_CACHE_VERSION}'.encode())
+    digest.update(path.read_bytes())
+    for source in sorted(path.parent.rglob('*.py')):
+        digest.update(source.relative_to(path.parent).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _check_python_names(src, manifest):
+    """Yield ``(python_name, error)`` for the python_names not found."""
+    commands = (manifest.get('contributions') or {}).get('commands') or []
+    for command in commands:
+        python_name = command.get('python_name')
+        if not python_name:
+            continue
+        module, _, attribute = python_name.partition(':')
+        if not attribute:
+            yield python_name, "expected 'module:attribute'"
+            continue
+        error = _find_attribute(src, module, attribute.split('.'))
+        if error:
+            yield python_name, error
+
+
+def _module_path(src, module):
+    """The source file of ``module`` in ``src``, or None."""
+    base = src.joinpath(*module.split('.'))
+    for path in (base.with_suffix('.py'), base / '__init__.py'):
+        if path.is_file():
+            return path
+    return None
+
+
+def _find_attribute(src, module, attributes, depth=0):
+    """Statically look up ``module.attributes``, returning an error or None.
+
+    Names are found where defined or assigned at the top level of the module
+    (including in ``if`` and ``try`` blocks), where imported, following
+    imports from the package, and in dicts mapping names to the submodules
+    they are lazily imported from by a module ``__getattr__``.
+    """
+    path = _module_path(src, module)
+    if path is None:
+        return f'module {module!r} not found in {src}'
+    if depth > 10:
+        return f'import cycle through {module!r}'
+    try:
+        tree = ast.parse(path.read_bytes(), str(path))
+    except SyntaxError as err:
+        return f'cannot parse {path}: {err}'
+    package = (
+        module if path.name == '__init__.py' else module.rpartition('.')[0]
+    )
+    name = attributes[0]
+
+    lazy_modules = {}
+    for node in _top_level_statements(tree.body):
+        if (
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == name
+        ):
+            return None if len(attributes) == 1 else f'{name!r} is a function'
+        if isinstance(node, ast.ClassDef) and node.name == name:
+            for member in attributes[1:]:
+                if member not in _class_members(node):
+                    return f'{member!r} not found in class {name!r}'
+            return None
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = (
+                node.targets if isinstance(node, ast.Assign) else [node.target]
+            )
+            if any(isinstance(t, ast.Name) and t.id == name for t in targets):
+                return None
+            if isinstance(node.value, ast.Dict):
+                lazy_modules.update(_lazy_imports(node.value))
+        if isinstance(node, ast.Import) and any(
+            (alias.asname or alias.name.partition('.')[0]) == name
+            for alias in node.names
+        ):
+            return None
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if (alias.asname or alias.name) != name:
+                    continue
+                target = _absolute_module(package, node.module, node.level)
+                if target.partition('.')[0] != module.partition('.')[0]:
+                    # imported from another distribution: trust it
+                    return None
+                if _module_path(src, f'{target}.{alias.name}'):
+                    return None
+                return _find_attribute(
+                    src, target, [alias.name, *attributes[1:]], depth + 1
+                )
+
+    if name in lazy_modules:
+        target = _absolute_module(
+            package, *_split_relative(lazy_modules[name])
+        )
+        return _find_attribute(src, target, attributes, depth + 1)
+    return f'{name!r} not found in {path}'
+
+
+def _top_level_statements(body):
+    """The statements of ``body``, and of the blocks it holds."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.If, ast.Try, ast.With)):
+            blocks = [node.body, getattr(node, 'orelse', [])]
+            blocks += [h.body for h in getattr(node, 'handlers', [])]
+            blocks.append(getattr(node, 'finalbody', []))
+            for block in blocks:
+                yield from _top_level_statements(block)
+
+
+def _class_members(node):
+    members = set()
+    for child in _top_level_statements(node.body):
+        if isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            members.add(child.name)
+        elif isinstance(child, ast.Assign):
+            members.update(
+                t.id for t in child.targets if isinstance(t, ast.Name)
+            )
+        elif isinstance(child, ast.AnnAssign) and isinstance(
+            child.target, ast.Name
+        ):
+            members.add(child.target.id)
+    return members
+
+
+def _lazy_imports(node):
+    """The ``{name: module}`` items of a dict literal of relative modules."""
+    items = {}
+    for key, value in zip(node.keys, node.values, strict=True):
+        if (
+            isinstance(key, ast.Constant)
+            and isinstance(key.value, str)
+            and isinstance(value, ast.Constant)
+            and isinstance(value.value, str)
+            and value.value.startswith('.')
+        ):
+            items[key.value] = value.value
+    return items
+
+
+def _split_relative(module):
+    """Split a relative module name like '..a.b' into ('a.b', 2)."""
+    stripped = module.lstrip('.')
+    return stripped or None, len(module) - len(stripped)
+
+
+def _absolute_module(package, module, level):
+    """The absolute name of ``from <level dots><module> import`` in ``package``."""
+    if not level:
+        return module
+    parts = package.split('.')
+    base = parts[: len(parts) - level + 1]
+    return '.'.join(base + ([module] if module else []))
+
+
 def initialize_new_repository(
     install_precommit=False,
     plugin_name='napari-foobar',
     plugin_directory='napari-foobar',
     github_repository_url='provide later',
     github_username_or_organization='githubuser',
+    timings=None,
 ):
     """Initialize new plugin repository with git, and optionally pre-commit."""
+    if timings is None:
+        timings = Timings()
 
     print("\n" + "="*50)
     print(Colors.info("Setting up your plugin repository..."))
@@ -112,15 +405,9 @@ def initialize_new_repository(
 
     # Configure git line ending settings quietly
     # devnull to suppress output
-    if os.name == 'nt':  # if on Windows, configure git line ending characters
-        subprocess.run(
-            ['git', 'config', '--global', 'core.autocrlf', 'true'],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-    else:  # for Linux and Mac
+    with timings.step('git config --global core.autocrlf'):
         subprocess.run(
-            ['git', 'config', '--global', 'core.autocrlf', 'input'],
+            ['git', 'config', '--global', 'core.autocrlf', _autocrlf()],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -128,18 +415,19 @@ def initialize_new_repository(
     # Initialize git repository
     try:
         print(Colors.info("Initializing git repository..."))
-        subprocess.run(
-            ['git', 'init', '-q'],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        subprocess.run(
-            ['git', 'checkout', '-b', 'main'],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        with timings.step('git init'):
+            subprocess.run(
+                ['git', 'init', '-q'],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            subprocess.run(
+                ['git', 'checkout', '-b', 'main'],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
         print(Colors.success("Git repository initialized"))
     except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
         print(Colors.error(f'Error in git initialization: {e}'))
@@ -150,52 +438,53 @@ def initialize_new_repository(
         # Try to install and update pre-commit
         try:
             # Check if we're in a uv environment to use uv's pip if available
-            in_uv_env = 'UV_PROJECT_ENVIRONMENT' in os.environ or subprocess.run(
-                ['uv', '--version'],
-                capture_output=True,
-                text=True
-            ).returncode == 0
+            with timings.step('uv --version'):
+                in_uv_env = 'UV_PROJECT_ENVIRONMENT' in os.environ or subprocess.run(
+                    ['uv', '--version'],
+                    capture_output=True,
+                    text=True
+                ).returncode == 0
+
+            with timings.step('install pre-commit'):
+                if in_uv_env:
+                    # Use uv to install pre-commit
+                    subprocess.run(
+                        ['uv', 'pip', 'install', 'pre-commit'],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=True,
+                    )
+                else:
+                    # Use regular pip
+                    subprocess.run(
+                        ['python', '-m', 'pip', 'install', 'pre-commit'],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=True,
+                    )
 
-            if in_uv_env:
-                # Use uv to install pre-commit
+            # Update pre-commit hooks
+            with timings.step('pre-commit autoupdate'):
                 subprocess.run(
-                    ['uv', 'pip', 'install', 'pre-commit'],
+                    ['pre-commit', 'autoupdate'],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    check=True,
                 )
-            else:
-                # Use regular pip
+
+            # Stage files and run pre-commit formatting
+            with timings.step('git add'):
                 subprocess.run(
-                    ['python', '-m', 'pip', 'install', 'pre-commit'],
+                    ['git', 'add', '.'],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    check=True,
                 )
-
-            # Update pre-commit hooks
-            subprocess.run(
-                ['pre-commit', 'autoupdate'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-
-            # Stage files and run pre-commit formatting
-            subprocess.run(
-                ['git', 'add', '.'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            subprocess.run(
-                ['pre-commit', 'run', 'ruff-check', '-a'],
-                capture_output=True,
-                check=False,
-            )
-            subprocess.run(
-                ['pre-commit', 'run', 'ruff-format', '-a'],
-                capture_output=True,
-                check=False,
-            )
+            for hook in ('ruff-check', 'ruff-format'):
+                with timings.step(f'pre-commit run {hook}'):
+                    subprocess.run(
+                        ['pre-commit', 'run', hook, '-a'],
+                        capture_output=True,
+                        check=False,
+                    )
             print(Colors.success("Pre-commit hooks configured"))
         except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
             print(Colors.warning(f'Could not install pre-commit (this is optional): {e}'))
@@ -203,23 +492,186 @@ def initialize_new_repository(
     # Create initial commit
     try:
         print(Colors.info("Creating initial commit..."))
-        subprocess.run(['git', 'add', '.'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        subprocess.run(
-            [
-                'git',
-                '-c', 'user.email=template@napari.org',
-                '-c', 'user.name=napari template',
-                'commit', '-q', '-m', 'initial commit',
-            ],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        with timings.step('git commit'):
+            subprocess.run(['git', 'add', '.'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            _initial_commit()
         print(Colors.success("Initial commit created"))
     except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
         print(Colors.error(f'Error creating initial git commit: {e}'))
         return _generate_manual_setup_message(plugin_name, plugin_directory, github_repository_url, github_username_or_organization)
 
+    _unhide_git_directory()
+
+    # Install pre-commit hooks after initial commit
+    if install_precommit is True:
+        try:
+            with timings.step('pre-commit install'):
+                subprocess.run(
+                    ['pre-commit', 'install'],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            print(Colors.success('Pre-commit hooks installed'))
+        except (subprocess.CalledProcessError, FileNotFoundError, OSError):
+            print(
+                Colors.warning(
+                    'Could not install pre-commit hooks (this is optional)'
+                )
+            )
+
+    return _generate_next_steps_message(
+        plugin_name,
+        plugin_directory,
+        github_repository_url,
+        github_username_or_organization,
+    )
+
+
+def initialize_new_repository_offline(
+    install_precommit=False,
+    plugin_name='napari-foobar',
+    plugin_directory='napari-foobar',
+    github_repository_url='provide later',
+    github_username_or_organization='githubuser',
+    timings=None,
+):
+    """Initialize new plugin repository quickly, without using the network.
+
+    Unlike ``initialize_new_repository``, this neither installs nor updates
+    pre-commit or its hooks: an installed pre-commit is used, and the ruff
+    hooks only run if their environments are already in the pre-commit
+    cache. Steps that don't depend on each other run concurrently, every
+    command has a timeout, and the global git config is left untouched.
+    """
+    if timings is None:
+        timings = Timings()
+
+    print('\n' + '=' * 50)
+    print(Colors.info('Setting up your plugin repository (offline)...'))
+    print('=' * 50 + '\n')
+
+    with ThreadPoolExecutor() as pool:
+        precommit = (
+            pool.submit(_find_precommit, timings)
+            if install_precommit
+            else None
+        )
+
+        try:
+            print(Colors.info('Initializing git repository...'))
+            with timings.step('git init'):
+                _run(['git', 'init', '-q', '-b', 'main'])
+                _run(['git', 'config', 'core.autocrlf', _autocrlf()])
+            print(Colors.success('Git repository initialized'))
+        except (
+            subprocess.CalledProcessError,
+            subprocess.TimeoutExpired,
+            OSError,
+        ) as e:
+            print(Colors.error(f'Error in git initialization: {e}'))
+            return _generate_manual_setup_message(
+                plugin_name,
+                plugin_directory,
+                github_repository_url,
+                github_username_or_organization,
+            )
+
+        precommit = precommit.result() if precommit else None
+        # the hooks are only installed, so they may run concurrently with the
+        # formatting: the initial commit below doesn't run them
+        hooks_installed = (
+            pool.submit(_install_precommit_hooks, precommit, timings)
+            if precommit
+            else None
+        )
+
+        try:
+            if precommit:
+                print(Colors.info('Running pre-commit formatting...'))
+                _run_cached_ruff_hooks(precommit, timings)
+        except (
+            subprocess.CalledProcessError,
+            subprocess.TimeoutExpired,
+            OSError,
+        ) as e:
+            print(
+                Colors.warning(
+                    f'Could not run pre-commit formatting (this is optional): {e}'
+                )
+            )
+
+        try:
+            print(Colors.info('Creating initial commit...'))
+            with timings.step('git commit'):
+                _run(['git', 'add', '.'])
+                _initial_commit()
+            print(Colors.success('Initial commit created'))
+        except (
+            subprocess.CalledProcessError,
+            subprocess.TimeoutExpired,
+            OSError,
+        ) as e:
+            print(Colors.error(f'Error creating initial git commit: {e}'))
+            return _generate_manual_setup_message(
+                plugin_name,
+                plugin_directory,
+                github_repository_url,
+                github_username_or_organization,
+            )
+
+        if hooks_installed and hooks_installed.result():
+            print(Colors.success('Pre-commit hooks installed'))
+
+    _unhide_git_directory()
+    return _generate_next_steps_message(
+        plugin_name,
+        plugin_directory,
+        github_repository_url,
+        github_username_or_organization,
+    )
+
+
+# timeout of each command in the offline setup, in seconds
+OFFLINE_TIMEOUT = 120
+
+
+def _run(command, **kwargs):
+    """Run ``command`` quietly, raising if it fails or times out."""
+    return subprocess.run(
+        command,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=OFFLINE_TIMEOUT,
+        **kwargs,
+    )
+
+
+def _autocrlf():
+    """The git line ending setting: convert to CRLF on Windows only."""
+    return 'true' if os.name == 'nt' else 'input'
+
+
+def _initial_commit():
+    # --no-verify: the hooks may already be installed by the offline setup
+    _run(
+        [
+            'git',
+            '-c',
+            'user.email=template@napari.org',
+            '-c',
+            'user.name=napari template',
+            'commit',
+            '-q',
+            '--no-verify',
+            '-m',
+            'initial commit',
+        ]
+    )
+
+
+def _unhide_git_directory():
     # Ensure full read/write/execute permissions for .git files on Windows
     if os.name == 'nt':
         with contextlib.suppress(Exception):
@@ -229,20 +681,91 @@ def initialize_new_repository(
                 stderr=subprocess.DEVNULL,
             )
 
-    # Install pre-commit hooks after initial commit
-    if install_precommit is True:
-        try:
+
+def _find_precommit(timings):
+    """Return the command running an installed pre-commit, or None."""
+    with timings.step('find pre-commit'):
+        if shutil.which('pre-commit'):
+            return ['pre-commit']
+        if importlib.util.find_spec('pre_commit') is not None:
+            return [sys.executable, '-m', 'pre_commit']
+    timings.skip('pre-commit', 'not installed')
+    print(
+        Colors.warning(
+            'pre-commit is not installed, skipping it (offline setup).'
+        )
+    )
+    return None
+
+
+def _install_precommit_hooks(precommit, timings):
+    try:
+        with timings.step('pre-commit install'):
+            _run([*precommit, 'install'])
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        print(
+            Colors.warning(
+                'Could not install pre-commit hooks (this is optional)'
+            )
+        )
+        return False
+    return True
+
+
+def _run_cached_ruff_hooks(precommit, timings):
+    """Run the ruff hooks, if pre-commit has their environment cached."""
+    hooks = ('ruff-check', 'ruff-format')
+    if not _hooks_cached(precommit, 'ruff-pre-commit'):
+        for hook in hooks:
+            timings.skip(
+                f'pre-commit run {hook}', 'hook environment not cached'
+            )
+        return
+    # pre-commit runs on the files known to git
+    with timings.step('git add'):
+        _run(['git', 'add', '.'])
+    for hook in hooks:
+        with timings.step(f'pre-commit run {hook}'):
+            # the hooks fail when they modify files, which is expected here
             subprocess.run(
-                ['pre-commit', 'install'],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                [*precommit, 'run', hook, '-a'],
+                capture_output=True,
+                check=False,
+                timeout=OFFLINE_TIMEOUT,
             )
-            print(Colors.success("Pre-commit hooks installed"))
-        except (subprocess.CalledProcessError, FileNotFoundError, OSError):
-            print(Colors.warning('Could not install pre-commit hooks (this is optional)'))
 
-    return _generate_next_steps_message(plugin_name, plugin_directory, github_repository_url, github_username_or_organization)
+
+def _hooks_cached(precommit, name):
+    """Whether pre-commit can run the hooks of repo ``name`` offline.
+
+    ``name`` must be a repo of ``.pre-commit-config.yaml``, and
+    ``pre-commit install-hooks`` must succeed with the network disabled:
+    only then are all repos, which pre-commit reads whatever hook it runs,
+    and their environments in the pre-commit cache.
+    """
+    try:
+        config = yaml.safe_load(Path('.pre-commit-config.yaml').read_text())
+        urls = [repo['repo'] for repo in config['repos']]
+    except (OSError, yaml.YAMLError, KeyError, TypeError):
+        return False
+    if not any(url.rstrip('/').endswith(name) for url in urls):
+        return False
+    try:
+        _run([*precommit, 'install-hooks'], env=_offline_env())
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+    return True
+
+
+def _offline_env():
+    """Environment in which git and pip can't reach the network."""
+    return {
+        **os.environ,
+        # git may only clone local repositories
+        'GIT_ALLOW_PROTOCOL': 'file',
+        'GIT_TERMINAL_PROMPT': '0',
+        'PIP_NO_INDEX': '1',
+    }
 
 
 def _generate_manual_setup_message(plugin_name, plugin_directory, github_repository_url, github_username_or_organization):
@@ -370,6 +893,18 @@ if __name__ == '__main__':
         help='Github user or organisation name',
         default='githubuser',
     )
+    parser.add_argument(
+        '--offline',
+        dest='offline',
+        help='Set up the repository without network access, concurrently (see initialize_new_repository_offline)',
+        default=os.environ.get('NAPARI_TEMPLATE_OFFLINE', 'False'),
+    )
+    parser.add_argument(
+        '--timings',
+        dest='timings',
+        help='Write the timing of each setup step to this JSON file',
+        default=os.environ.get('NAPARI_TEMPLATE_TIMINGS'),
+    )
     args = parser.parse_args()
 
     # Since bool("False") returns True, we need to check the actual string value
@@ -379,12 +914,25 @@ if __name__ == '__main__':
         install_precommit = False
     module_name_pep8_compliance(args.module_name)
     pypi_package_name_compliance(args.plugin_name)
-    validate_manifest(args.module_name, args.project_directory)
-    msg = initialize_new_repository(
+    offline = str(args.offline).lower() in ('true', '1', 'yes')
+    timings = Timings()
+    with timings.step('validate manifest'):
+        validate_manifest(args.module_name, args.project_directory)
+    initialize = (
+        initialize_new_repository_offline
+        if offline
+        else initialize_new_repository
+    )
+    msg = initialize(
         install_precommit=install_precommit,
         plugin_name=args.plugin_name,
         plugin_directory=args.project_directory,
         github_repository_url=args.github_repository_url,
         github_username_or_organization=args.github_username_or_organization,
+        timings=timings,
     )
     print(msg)
+    if offline or args.timings:
+        print(timings.report())
+    if args.timings:
+        timings.write(args.timings)
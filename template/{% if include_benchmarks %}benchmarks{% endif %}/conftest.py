@@ -0,0 +1,104 @@
+"""
+Configuration of the benchmark suite.
+
+The benchmarks are run with pytest-benchmark, see
+https://pytest-benchmark.readthedocs.io/, through the ``measure`` fixture,
+which also records the peak memory allocated by the benchmarked function.
+
+Run them with ``tox -e benchmark``. Pass ``--save-baseline`` (after ``--``)
+to store the results as the baseline in ``benchmarks/baseline.json``; the
+following runs are then compared against it, and fail if a benchmark got
+slower or uses more memory than the tolerances below allow.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+# relative increase of the minimal time of a benchmark considered a regression
+TIME_TOLERANCE = 0.25
+# relative increase of the peak memory considered a regression
+MEMORY_TOLERANCE = 0.10
+# peak memory below which differences are ignored, in bytes
+MIN_MEMORY = 2**20
+
+_regressions = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmark baseline')
+    group.addoption(
+        '--baseline',
+        default='benchmarks/baseline.json',
+        help='Results the benchmarks are compared against.',
+    )
+    group.addoption(
+        '--save-baseline',
+        action='store_true',
+        help='Save the results as the baseline instead of comparing them.',
+    )
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Benchmark ``func(*args, **kwargs)`` and record its peak memory."""
+
+    def measure(func, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info['peak_memory'] = peak
+        return benchmark(func, *args, **kwargs)
+
+    return measure
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    path = config.rootpath / config.getoption('baseline')
+    if config.getoption('save_baseline'):
+        path.write_text(json.dumps(output_json, indent=2))
+        return
+    if not path.is_file():
+        return
+
+    baseline = {
+        bench['fullname']: bench
+        for bench in json.loads(path.read_text())['benchmarks']
+    }
+    regressions = config.stash.setdefault(_regressions, [])
+    for bench in output_json['benchmarks']:
+        old = baseline.get(bench['fullname'])
+        if old is None:
+            continue
+        time, old_time = bench['stats']['min'], old['stats']['min']
+        if time > old_time * (1 + TIME_TOLERANCE):
+            regressions.append(
+                f'{bench["fullname"]}: {time * 1e3:.3f} ms '
+                f'(baseline {old_time * 1e3:.3f} ms)'
+            )
+        peak = bench['extra_info'].get('peak_memory', 0)
+        old_peak = old['extra_info'].get('peak_memory', 0)
+        if peak > max(old_peak * (1 + MEMORY_TOLERANCE), MIN_MEMORY):
+            regressions.append(
+                f'{bench["fullname"]}: {peak / 2**20:.1f} MiB peak memory '
+                f'(baseline {old_peak / 2**20:.1f} MiB)'
+            )
+
+
+def pytest_sessionfinish(session):
+    # pytest-benchmark writes its results, and so calls
+    # pytest_benchmark_update_json, before this hook runs
+    if session.config.stash.get(_regressions, None):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    regressions = config.stash.get(_regressions, None)
+    if regressions:
+        terminalreporter.section('benchmark regressions', red=True)
+        for regression in regressions:
+            terminalreporter.line(regression, red=True)
@@ -3,10 +3,13 @@ test_create_template
 --------------------
 """
 
+import json
 import os
 import subprocess
+from pathlib import Path
 
 import pytest
+from plumbum import local
 
 
 def run_tox(plugin):
@@ -149,6 +152,124 @@ def test_run_select_plugins(copie, capsys):
     assert not result.project_dir.joinpath('tests', 'test_writer.py').is_file()
 
 
+@pytest.mark.parametrize('include_benchmarks', [True, False])
+def test_run_select_benchmarks(copie, capsys, include_benchmarks):
+    """Benchmarks are only generated for the contributions included."""
+    result = copie.copy(
+        extra_answers={
+            'plugin_name': 'anything',
+            'display_name': 'Foo Bar',
+            'module_name': 'anything',
+            'short_description': 'Super fast foo for all the bars',
+            'full_name': 'napari bot',
+            'email': 'etal@example.com',
+            'github_username_or_organization': 'napari',
+            'include_writer_plugin': 'n',
+            'include_benchmarks': include_benchmarks,
+        }
+    )
+
+    assert result.exit_code == 0
+    assert result.exception is None
+    bench_path = result.project_dir.joinpath('benchmarks')
+    if not include_benchmarks:
+        assert not bench_path.exists()
+        return
+
+    assert (bench_path / 'conftest.py').is_file()
+    assert (bench_path / 'bench_reader.py').is_file()
+    assert (bench_path / 'bench_widget.py').is_file()
+    assert not (bench_path / 'bench_writer.py').is_file()
+    with open(result.project_dir / 'tox.ini') as f:
+        assert '[testenv:benchmark]' in f.read()
+    with open(result.project_dir / 'pyproject.toml') as f:
+        assert '"pytest-benchmark"' in f.read()
+
+
+def test_offline_setup(copie, tmp_path):
+    """The offline setup creates the repository and reports its timings."""
+    timings = tmp_path / 'timings.json'
+    # copier runs its tasks in plumbum's copy of the environment
+    with local.env(
+        NAPARI_TEMPLATE_OFFLINE='1', NAPARI_TEMPLATE_TIMINGS=str(timings)
+    ):
+        result = copie.copy(
+            extra_answers={
+                'plugin_name': 'anything',
+                'display_name': 'Foo Bar',
+                'module_name': 'anything',
+                'short_description': 'Super fast foo for all the bars',
+                'full_name': 'napari bot',
+                'email': 'etal@example.com',
+                'github_username_or_organization': 'napari',
+                'install_precommit': True,
+            }
+        )
+
+    assert result.exit_code == 0
+    log = subprocess.run(
+        ['git', 'log', '--format=%s'],
+        cwd=result.project_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert log.stdout == 'initial commit\n'
+    with open(timings) as f:
+        steps = [step['step'] for step in json.load(f)['steps']]
+    assert {'validate manifest', 'git init', 'git commit'} <= set(steps)
+    assert 'pre-commit autoupdate' not in steps
+
+
+def test_validate_manifest(copie, capsys, monkeypatch, tmp_path):
+    """python_names are checked without importing the plugin, and cached."""
+    monkeypatch.syspath_prepend(str(Path(__file__).parents[1]))
+    monkeypatch.setenv('NAPARI_TEMPLATE_CACHE', str(tmp_path))
+    import _tasks
+
+    result = copie.copy(
+        extra_answers={
+            'plugin_name': 'anything',
+            'display_name': 'Foo Bar',
+            'module_name': 'anything',
+            'short_description': 'Super fast foo for all the bars',
+            'full_name': 'napari bot',
+            'email': 'etal@example.com',
+            'github_username_or_organization': 'napari',
+        }
+    )
+    assert result.exit_code == 0
+    project = str(result.project_dir)
+    capsys.readouterr()
+
+    assert _tasks.validate_manifest('anything', project)
+    assert '(cached)' not in capsys.readouterr().out
+    assert _tasks.validate_manifest('anything', project)
+    assert '(cached)' in capsys.readouterr().out
+
+    # NAPARI_TEMPLATE_CACHE=0 turns the cache off
+    monkeypatch.setenv('NAPARI_TEMPLATE_CACHE', '0')
+    assert _tasks.validate_manifest('anything', project)
+    assert '(cached)' not in capsys.readouterr().out
+    assert not Path('0').exists()
+
+    # a widget lazily imported by __init__.py, from a missing module
+    init = result.project_dir / 'src' / 'anything' / '__init__.py'
+    init.write_text(init.read_text().replace("'._widget'", "'._widgets'"))
+    with pytest.raises(SystemExit):
+        _tasks.validate_manifest('anything', project)
+    out = capsys.readouterr().out
+    assert "anything:ImageThreshold: module 'anything._widgets'" in out
+
+    manifest = result.project_dir / 'src' / 'anything' / 'napari.yaml'
+    manifest.write_text(
+        manifest.read_text().replace('napari_get_reader', 'missing')
+    )
+    with pytest.raises(SystemExit):
+        _tasks.validate_manifest('anything', project)
+    assert "'missing' not found" in capsys.readouterr().out
+
+
 def test_pre_commit_validity(copie):
     """Verify pre-commit passes on a fully-featured generated plugin.
 